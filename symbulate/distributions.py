@@ -4,6 +4,55 @@ import matplotlib.pyplot as plt
 
 from .probability_space import ProbabilitySpace
 from .plot import configure_axes, get_next_color
+from .seed import get_seed
+from .sequences import InfiniteSequence
+
+CHUNK_SIZE = 64
+
+class _ExponentialDraw(InfiniteSequence):
+    """An infinite sequence of i.i.d. exponential draws.
+
+    The draws are simulated lazily, in chunks that double in size
+    each time more are needed, and cached along with their
+    running totals (e.g., the arrival times of a Poisson process).
+    """
+
+    def __init__(self, scale):
+        self.scale = scale
+        self.random_state = np.random.RandomState(get_seed())
+        self.values = np.empty(0)
+        self.totals = np.empty(0)
+        super().__init__(self.get)
+
+    def extend(self):
+        size = max(len(self.values), CHUNK_SIZE)
+        values = self.random_state.exponential(scale=self.scale, size=size)
+        total = self.totals[-1] if len(self.totals) else 0
+        self.values = np.append(self.values, values)
+        self.totals = np.append(self.totals, total + np.cumsum(values))
+
+    def get(self, n):
+        while n >= len(self.values):
+            self.extend()
+        return self.values[int(n)].item()
+
+    def total(self, n):
+        """Returns the sum of the first n draws."""
+        if n == 0:
+            return 0
+        self.get(n - 1)
+        return self.totals[int(n) - 1].item()
+
+class _ExponentialStream(ProbabilitySpace):
+    """Defines the probability space for an infinite sequence of
+         i.i.d. exponential draws, i.e., Exponential(rate) ** inf.
+    """
+
+    def __init__(self, scale):
+        self.scale = scale
+
+    def draw(self):
+        return _ExponentialDraw(self.scale)
 
 class Distribution(ProbabilitySpace):
     def __init__(self, params, scipy, discrete = True):
@@ -456,6 +505,13 @@ class Exponential(Distribution):
         else:
             return np.random.exponential(scale=self.scale)
 
+    def __pow__(self, exponent):
+        # draw infinite sequences in batches, rather than one at a time
+        if exponent == float("inf"):
+            return _ExponentialStream(self.params["scale"])
+        else:
+            return super().__pow__(exponent)
+
 class Gamma(Distribution):
     """Defines a probability space for a gamma distribution.
        Only one of scale or rate should be set. (The scale is the
@@ -5,7 +5,7 @@ from .probability_space import ProbabilitySpace
 from .random_processes import RandomProcess, TimeIndex
 from .random_variables import RV
 from .seed import get_seed
-from .sequences import InfiniteSequence
+from .sequences import InfiniteSequence, RandomSequence
 
 EPS = 1e-15
 
@@ -25,18 +25,18 @@ class MarkovChain(RandomProcess):
 
         self.check_transition_matrix(transition_matrix)
         
+        def next_state(states):
+            if not states:
+                return np.random.choice(range(m), p=initial_dist)
+            else:
+                return np.random.choice(range(m), p=transition_matrix[states[-1]])
+
         def draw():
-            seed = get_seed()
-            def x(n):
-                np.random.seed(seed)
-                state = np.random.choice(range(m), p=initial_dist)
-                for _ in range(int(n)):
-                    state = np.random.choice(range(m), p=transition_matrix[state])
-                if state_labels is None:
-                    return state
-                else:
-                    return state_labels[state]
-            return InfiniteSequence(x)
+            states = RandomSequence(next_state, get_seed())
+            if state_labels is None:
+                return states
+            else:
+                return InfiniteSequence(lambda n: state_labels[states[n]])
         
         def fun(x, n):
             return x[n]
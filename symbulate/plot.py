@@ -1,5 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
+
 from .sequences import InfiniteSequence
 from scipy.stats import gaussian_kde
 
@@ -44,20 +45,8 @@ def plot(*args, **kwargs):
 def is_discrete(heights):
     return sum([(i > 1) for i in heights]) > .8 * len(heights)
 
-def count_var(x):
-    counts = {}
-    for val in x:
-        if val in counts:
-            counts[val] += 1
-        else:
-            counts[val] = 1
-    return counts
-    
 def compute_density(values):
-    density = gaussian_kde(values)
-    density.covariance_factor = lambda: 0.25
-    density._compute_covariance()
-    return density
+    return gaussian_kde(values, bw_method=0.25)
 
 def setup_ticks(pos, lab, ax):
     ax.set_ticks(pos)
@@ -79,25 +68,22 @@ def setup_tile(v, bins, discrete):
     if not discrete:
         v_lab = np.linspace(min(v), max(v), bins + 1)
         v_pos = np.arange(0, len(v_lab)) - 0.5
-        v_vect = np.digitize(v, v_lab, right=True) - 1
+        # the minimum falls on the left edge, so put it in the first bin
+        v_vect = np.maximum(np.digitize(v, v_lab, right=True) - 1, 0)
     else:
         v_lab = np.unique(v) #returns sorted array
         v_pos = range(len(v_lab))
-        v_map = dict(zip(v_lab, v_pos))
-        v_vect = np.vectorize(v_map.get)(v)
+        v_vect = np.searchsorted(v_lab, v)
     return v_vect, v_lab, v_pos
 
 def make_tile(x, y, bins, discrete_x, discrete_y, ax):
     x_vect, x_lab, x_pos = setup_tile(x, bins, discrete_x)
     y_vect, y_lab, y_pos = setup_tile(y, bins, discrete_y)
     nums = len(x_vect)
-    counts = count_var(list(zip(y_vect, x_vect)))
     y_shape = len(y_lab) if discrete_y else len(y_lab) - 1
     x_shape = len(x_lab) if discrete_x else len(x_lab) - 1
     intensity = np.zeros(shape=(y_shape, x_shape))
-        
-    for key, val in counts.items():
-        intensity[key] = val / nums
+    np.add.at(intensity, (y_vect, x_vect), 1 / nums)
     if not discrete_x: x_lab = np.around(x_lab, decimals=1)
     if not discrete_y: y_lab = np.around(y_lab, decimals=1)
     hm = ax.matshow(intensity, cmap='Blues', origin='lower', aspect='auto')
@@ -131,11 +117,10 @@ def make_marginal_impulse(count, color, ax_marg, alpha, axis):
     elif axis == 'y':
         ax_marg.hlines(key, 0, val, color=color, alpha=alpha)
 
-def make_density2D(x, y, ax):
-    res = np.vstack([x, y])
-    density = gaussian_kde(res)
-    xmax, xmin = max(x), min(x)
-    ymax, ymin = max(y), min(y)
+def make_density2D(res, ax):
+    density = gaussian_kde(res.T)
+    xmin, ymin = res.min(0)
+    xmax, ymax = res.max(0)
     Xgrid, Ygrid = np.meshgrid(np.linspace(xmin, xmax, 100),
                                np.linspace(ymin, ymax, 100))
     Z = density.evaluate(np.vstack([Xgrid.ravel(), Ygrid.ravel()]))
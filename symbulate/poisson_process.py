@@ -1,31 +1,40 @@
+import numpy as np
+
+from functools import partial
+
 from .distributions import Exponential
 from .math import inf
 from .random_processes import RandomProcess, TimeIndex
+from .sequences import TimeFunction
+from .utils import is_scalar
+
+def _count_arrivals(x, t):
+    # simulate arrivals until they are past every time in t
+    while len(x.totals) == 0 or x.totals[-1] <= np.max(t):
+        x.extend()
+    n = np.searchsorted(x.totals, t, side="right")
+    return int(n) if is_scalar(t) else n
+
 
 class PoissonProcess(RandomProcess):
 
     def __init__(self, rate):
         self.rate = rate
-        self.probSpace = Exponential(rate=rate) ** inf
-        self.timeIndex = TimeIndex(fs=inf)
-        def fun(x, t):
-            n = 0
-            total_time = 0
-            while True:
-                total_time += x[n]
-                if total_time > t:
-                    break
-                else:
-                    n += 1
-            return n
-        self.fun = fun
+        super().__init__(Exponential(rate=rate) ** inf, TimeIndex(fs=inf), _count_arrivals)
+        self._vectorized_fun = True
+
+    def draw(self):
+        # values assigned with N[t] = ... are handled by RandomProcess
+        if self._overrides:
+            return super().draw()
+        # a sample path is determined by its interarrival times,
+        # so count the arrivals directly, at one or many times
+        outcome = self.probSpace.draw()
+        return TimeFunction(partial(_count_arrivals, outcome), self.timeIndex, True)
 
     def ArrivalTimes(self):
         def fun(x, n):
-            total = 0
-            for i in range(int(n)):
-                total += x[i]
-            return total
+            return x.total(n)
         return RandomProcess(self.probSpace, TimeIndex(1), fun)
 
     def InterarrivalTimes(self):
@@ -1,7 +1,7 @@
 import numpy as np
 
 from .results import Results
-from .sequences import InfiniteSequence
+from .sequences import RandomSequence
 from .seed import get_seed
 
 class ProbabilitySpace:
@@ -42,13 +42,7 @@ class ProbabilitySpace:
     def __pow__(self, exponent):
         if exponent == float("inf"):
             def draw():
-                seed = get_seed()
-                def x(n):
-                    np.random.seed(seed)
-                    for _ in range(int(n)):
-                        self.draw()
-                    return self.draw()
-                return InfiniteSequence(x)
+                return RandomSequence(lambda terms: self.draw(), get_seed())
         else:
             def draw():
                 return tuple(self.draw() for _ in range(exponent))
@@ -169,13 +163,7 @@ class BoxModel(ProbabilitySpace):
         elif self.size == float("inf"):
             if self.replace == False:
                 raise Exception("Cannot draw an infinite number of tickets without replacement.")
-            seed = get_seed()
-            def x(n):
-                np.random.seed(seed)
-                for _ in range(int(n)):
-                    draw_inds(None)
-                return self.box[draw_inds(None)]
-            return InfiniteSequence(x)
+            return RandomSequence(lambda terms: self.box[draw_inds(None)], get_seed())
         else:
             draws = [self.box[i] for i in draw_inds(self.size)]
             if not self.order_matters:
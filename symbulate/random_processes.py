@@ -1,7 +1,7 @@
 import numpy as np
+import operator
 
 from math import floor
-from copy import deepcopy
 
 from .probability_space import ArbitrarySpace
 from .random_variables import RV
@@ -17,40 +17,64 @@ class RandomProcess:
         self.probSpace = probSpace
         self.timeIndex = timeIndex
         self.fun = fun
+        self._overrides = {}
+        # the function before any values were assigned with X[t] = ...
+        self._base_fun = fun
+        # whether fun can be evaluated at an array of times at once
+        self._vectorized_fun = False
+
+    @property
+    def _vectorized(self):
+        # values assigned with X[t] = ... are only looked up
+        # one time at a time
+        return self._vectorized_fun and not self._overrides
 
     def draw(self):
         outcome = self.probSpace.draw()
         def f(t):
             return self.fun(outcome, t)
-        return TimeFunction(f, self.timeIndex)
+        return TimeFunction(f, self.timeIndex, self._vectorized)
 
     def sim(self, n):
+        """Simulate n sample paths of the random process.
+
+        When the probability space is an infinite sequence (e.g.,
+        Normal() ** inf), each sample path is drawn from its own
+        seed, and its values are only simulated when the path is
+        evaluated, e.g., when plotting.
+
+        Args:
+          n (int): How many sample paths to draw.
+
+        Returns:
+          RandomProcessResults: A list-like object containing
+            the sample paths.
+        """
         return RandomProcessResults([self.draw() for _ in range(n)], self.timeIndex)
 
     def __getitem__(self, t):
-        fun_copy = deepcopy(self.fun)
+        fun = self.fun
         if is_scalar(t):
-            return RV(self.probSpace, lambda x: fun_copy(x, t))
+            return RV(self.probSpace, lambda x: fun(x, t))
         elif isinstance(t, RV):
-            return RV(self.probSpace, lambda x: fun_copy(x, t.fun(x)))
+            return RV(self.probSpace, lambda x: fun(x, t.fun(x)))
     
     def __setitem__(self, t, value):
-        # copy existing function to use inside redefined function
-        fun_copy = deepcopy(self.fun)
-        if is_scalar(value):
-            def fun_new(x, s):
-                if s == t:
-                    return value
-                else:
-                    return fun_copy(x, s)
-        elif isinstance(value, RV):
-            def fun_new(x, s):
-                if s == t:
-                    return value.fun(x)
-                else:
-                    return fun_copy(x, s)
-        else:
+        if not (is_scalar(value) or isinstance(value, RV)):
             raise Exception("The value of the process at any time t must be a RV.")
+        # copy the overrides rather than updating them in place, so
+        # that RVs already defined from this process (e.g., X[t - 1])
+        # keep the values they were defined with
+        overrides = dict(self._overrides)
+        overrides[t] = value
+        fun = self._base_fun
+        def fun_new(x, s):
+            if is_scalar(s) and s in overrides:
+                value = overrides[s]
+                return value.fun(x) if isinstance(value, RV) else value
+            else:
+                return fun(x, s)
+        self._overrides = overrides
         self.fun = fun_new
 
     def apply(self, function):
@@ -76,40 +100,16 @@ class RandomProcess:
     def __abs__(self):
         return self.apply(lambda x: abs(x))
 
-    # The code for most operations (+, -, *, /, ...) is the
-    # same, except for the operation itself. The following 
-    # factory function takes in the the operation and 
-    # generates the code to perform that operation.
-    def _operation_factory(self, op):
-
-        def op_fun(self, other):
-            self.check_same_probSpace(other)
-            self.check_same_timeIndex(other)
-            if is_scalar(other):
-                def fun(x, t):
-                    return op(self.fun(x, t), other)
-            elif isinstance(other, RV):
-                def fun(x, t):
-                    return op(self.fun(x, t), other.fun(x))
-            elif isinstance(other, RandomProcess):
-                def fun(x, t):
-                    return op(self.fun(x, t), other.fun(x, t))
-            return RandomProcess(self.probSpace, self.timeIndex, fun)
-
-        return op_fun
-
     # e.g., X(t) + Y(t) or X(t) + Y or X(t) + 3
     def __add__(self, other):
-        op_fun = self._operation_factory(lambda x, y: x + y)
-        return op_fun(self, other)
+        return _BinOpProcess(operator.add, self, other)
 
     def __radd__(self, other):
         return self.__add__(other)
 
     # e.g., X(t) - Y(t) or X(t) - Y or X(t) - 3
     def __sub__(self, other):
-        op_fun = self._operation_factory(lambda x, y: x - y)
-        return op_fun(self, other)
+        return _BinOpProcess(operator.sub, self, other)
 
     def __rsub__(self, other):
         return -1 * self.__sub__(other)
@@ -119,29 +119,24 @@ class RandomProcess:
 
     # e.g., X(t) * Y(t) or X(t) * Y or X * 2
     def __mul__(self, other):
-        op_fun = self._operation_factory(lambda x, y: x * y)
-        return op_fun(self, other)
+        return _BinOpProcess(operator.mul, self, other)
     
     def __rmul__(self, other):
         return self.__mul__(other)
 
     # e.g., X(t) / Y(t) or X(t) / Y or X / 2
     def __truediv__(self, other):
-        op_fun = self._operation_factory(lambda x, y: x / y)
-        return op_fun(self, other)
+        return _BinOpProcess(operator.truediv, self, other)
 
     def __rtruediv__(self, other):
-        op_fun = self._operation_factory(lambda x, y: y / x)
-        return op_fun(self, other)
+        return _BinOpProcess(operator.truediv, other, self)
 
     # e.g., X(t) ** Y(t) or X(t) ** Y or X(t) ** 2
     def __pow__(self, other):
-        op_fun = self._operation_factory(lambda x, y: x ** y)
-        return op_fun(self, other)
+        return _BinOpProcess(operator.pow, self, other)
 
     def __rpow__(self, other):
-        op_fun = self._operation_factory(lambda x, y: y ** x)
-        return op_fun(self, other)
+        return _BinOpProcess(operator.pow, other, self)
 
     # Alternative notation for powers: e.g., X ^ 2
     def __xor__(self, other):
@@ -167,3 +162,51 @@ class RandomProcess:
         else:
             raise Exception("Joint distributions are only defined for random processes.")
 
+
+
+class _BinOpProcess(RandomProcess):
+    """A random process defined by a binary operation, such as +,
+         between a random process and another random process,
+         a RV, or a number.
+
+    Attributes:
+      op (function): the operation, e.g., operator.add
+      left: the left operand
+      right: the right operand
+    """
+
+    def __init__(self, op, left, right):
+        self.op = op
+        self.left = left
+        self.right = right
+
+        process, other = (left, right) if isinstance(left, RandomProcess) else (right, left)
+        process.check_same_probSpace(other)
+        process.check_same_timeIndex(other)
+
+        def fun(x, t):
+            return op(_evaluate(left, x, t), _evaluate(right, x, t))
+
+        super().__init__(process.probSpace, process.timeIndex, fun)
+        # numpy cannot raise integer arrays to negative powers,
+        # so only evaluate powers with a nonnegative number as
+        # the exponent at an array of times
+        self._vectorized_fun = op is not operator.pow or (
+            is_scalar(right) and right >= 0)
+
+    @property
+    def _vectorized(self):
+        # the operands are checked on each lookup, since they may be
+        # redefined (e.g., N[1] = 100) after this process is built
+        return RandomProcess._vectorized.fget(self) and all(
+            operand._vectorized for operand in (self.left, self.right)
+            if isinstance(operand, RandomProcess))
+
+
+def _evaluate(operand, x, t):
+    if isinstance(operand, RandomProcess):
+        return operand.fun(x, t)
+    elif isinstance(operand, RV):
+        return operand.fun(x)
+    else:
+        return operand
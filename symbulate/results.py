@@ -7,21 +7,20 @@ random process.
 """
 
 import numpy as np
+import operator as op
+import reprlib
 import matplotlib.pyplot as plt
-import matplotlib.cm as cm
 
-from numbers import Number
 from collections import Counter
+from itertools import compress, islice
 
 from .sequences import TimeFunction
 from .table import Table
 from .utils import is_scalar, is_vector, get_dimension
 from .plot import (configure_axes, get_next_color, is_discrete,
-    count_var, compute_density, add_colorbar, make_tile,
+    compute_density, add_colorbar, make_tile,
     setup_ticks, make_violin, make_marginal_impulse, make_density2D)
-from scipy.stats import gaussian_kde
 from matplotlib.gridspec import GridSpec
-from matplotlib.ticker import NullFormatter
 from matplotlib.transforms import Affine2D
 
 plt.style.use('seaborn-colorblind')
@@ -29,11 +28,61 @@ plt.style.use('seaborn-colorblind')
 def is_hashable(x):
     return x.__hash__ is not None
 
+# formats only as much of a long list or tuple as can be displayed
+_brief = reprlib.Repr()
+_brief.maxlist = _brief.maxtuple = 40
+_brief.maxstring = _brief.maxother = 100
+
+def brief_str(x, limit=100):
+    if isinstance(x, (list, tuple)):
+        result = _brief.repr(x)
+    else:
+        result = str(x)
+    if len(result) > limit:
+        return result[:limit] + "..."
+    else:
+        return result
+
+def _clears_cache(name):
+    # wraps a list method that modifies the outcomes, so that
+    # anything computed from the old outcomes is recomputed
+    method = getattr(list, name)
+    def fun(self, *args, **kwargs):
+        self._clear_cache()
+        return method(self, *args, **kwargs)
+    fun.__name__ = name
+    fun.__doc__ = method.__doc__
+    return fun
+
 class Results(list):
 
     def __init__(self, results):
-        for result in results:
-            self.append(result)
+        super().__init__(results)
+        self._array = None
+
+    def _clear_cache(self):
+        self._array = None
+
+    append = _clears_cache("append")
+    extend = _clears_cache("extend")
+    insert = _clears_cache("insert")
+    pop = _clears_cache("pop")
+    remove = _clears_cache("remove")
+    clear = _clears_cache("clear")
+    sort = _clears_cache("sort")
+    reverse = _clears_cache("reverse")
+    __setitem__ = _clears_cache("__setitem__")
+    __delitem__ = _clears_cache("__delitem__")
+    __iadd__ = _clears_cache("__iadd__")
+    __imul__ = _clears_cache("__imul__")
+
+    @property
+    def _as_array(self):
+        # the outcomes are only converted to an array once,
+        # until they are modified
+        if self._array is None:
+            self._array = np.asarray(self)
+        return self._array
 
     def apply(self, fun):
         """Apply a function to each outcome of a simulation.
@@ -53,12 +102,17 @@ class Results(list):
         return self.apply(lambda x: x[i])
 
     def get(self, i):
-        for j, x in enumerate(self):
-            if j == i:
-                return x
+        # __getitem__ is overridden to index into each outcome,
+        # so use list's indexing to get the ith outcome itself
+        return list.__getitem__(self, i)
 
     def _get_counts(self):
-        counts = {}
+        try:
+            return Counter(self)
+        except TypeError:
+            # some outcomes are not hashable
+            pass
+        counts = Counter()
         for x in self:
             if is_hashable(x):
                 y = x
@@ -66,10 +120,7 @@ class Results(list):
                 y = tuple(x)
             else:
                 y = str(x)
-            if y in counts:
-                counts[y] += 1
-            else:
-                counts[y] = 1
+            counts[y] += 1
         return counts
 
     def tabulate(self, outcomes=None, normalize=False):
@@ -118,23 +169,48 @@ class Results(list):
         """
         return type(self)(x for x in self if fun(x))
 
+    def _compare(self, compare, value):
+        # Compares all of the outcomes to value at once, if they are
+        # numbers. Returns None if the outcomes are not all numbers.
+        if not is_scalar(value):
+            return None
+        # check the first outcome before converting all of them,
+        # e.g., so tuples or strings are not converted to an array
+        if not self or not is_scalar(list.__getitem__(self, 0)):
+            return None
+        try:
+            res = self._as_array
+        except ValueError:
+            return None
+        if res.ndim == 1 and res.dtype.kind in "biuf":
+            return compare(res, value)
+        else:
+            return None
+
+    def _filter_op(self, compare, value):
+        mask = self._compare(compare, value)
+        if mask is None:
+            return self.filter(lambda x: compare(x, value))
+        else:
+            return type(self)(compress(self, mask))
+
     def filter_eq(self, value):
-        return self.filter(lambda x: x == value)
+        return self._filter_op(op.eq, value)
 
     def filter_neq(self, value):
-        return self.filter(lambda x: x != value)
+        return self._filter_op(op.ne, value)
 
     def filter_lt(self, value):
-        return self.filter(lambda x: x < value)
+        return self._filter_op(op.lt, value)
 
     def filter_leq(self, value):
-        return self.filter(lambda x: x <= value)
+        return self._filter_op(op.le, value)
 
     def filter_gt(self, value):
-        return self.filter(lambda x: x > value)
+        return self._filter_op(op.gt, value)
 
     def filter_geq(self, value):
-        return self.filter(lambda x: x >= value)
+        return self._filter_op(op.ge, value)
 
 
     # The following functions return an integer indicating
@@ -154,25 +230,32 @@ class Results(list):
           int: The number of outcomes for which
             the function returned True.
         """
-        return len(self.filter(fun))
+        return sum(1 for x in self if fun(x))
+
+    def _count_op(self, compare, value):
+        mask = self._compare(compare, value)
+        if mask is None:
+            return self.count(lambda x: compare(x, value))
+        else:
+            return int(mask.sum())
 
     def count_eq(self, value):
-        return len(self.filter_eq(value))
+        return self._count_op(op.eq, value)
 
     def count_neq(self, value):
-        return len(self.filter_neq(value))
+        return self._count_op(op.ne, value)
 
     def count_lt(self, value):
-        return len(self.filter_lt(value))
+        return self._count_op(op.lt, value)
 
     def count_leq(self, value):
-        return len(self.filter_leq(value))
+        return self._count_op(op.le, value)
 
     def count_gt(self, value):
-        return len(self.filter_gt(value))
+        return self._count_op(op.gt, value)
 
     def count_geq(self, value):
-        return len(self.filter_geq(value))
+        return self._count_op(op.ge, value)
 
 
     # The following functions define vectorized operations
@@ -259,26 +342,38 @@ class Results(list):
         </tr>
         '''
 
-        def truncate(result):
-            if len(result) > 100:
-                return result[:100] + "..."
-            else:
-                return result
-
-        table_body = ""
-        for i, x in enumerate(self):
-            table_body += row_template % (i, truncate(str(x)))
-            # if we've already printed 9 rows, skip to end
-            if i >= 8:
-                table_body += "<tr><td>...</td><td>...</td></tr>"
-                i_last = len(self) - 1
-                table_body += row_template % (i_last, truncate(str(self.get(i_last))))
-                break
-        return table_template.format(table_body=table_body)
+        # print the first 9 rows, then skip to the end
+        rows = [row_template % (i, brief_str(x))
+                for i, x in enumerate(islice(self, 9))]
+        if len(self) > 9:
+            rows.append("<tr><td>...</td><td>...</td></tr>")
+            i_last = len(self) - 1
+            rows.append(row_template % (i_last, brief_str(self.get(i_last))))
+        return table_template.format(table_body="".join(rows))
 
 
 class RVResults(Results):
 
+    def __init__(self, results):
+        super().__init__(results)
+        self._dim_cache = None
+
+    def _clear_cache(self):
+        super()._clear_cache()
+        self._dim_cache = None
+
+    @property
+    def _dim(self):
+        # 0 if the outcomes are all scalars; otherwise, their common
+        # length (or None if the lengths differ). This is computed
+        # once, until the outcomes are modified.
+        if self._dim_cache is None:
+            if all(is_scalar(x) for x in self):
+                self._dim_cache = 0
+            else:
+                self._dim_cache = get_dimension(self)
+        return self._dim_cache
+
     def plot(self, type=None, alpha=None, normalize=True, jitter=False, 
         bins=None, **kwargs):
         if type is not None:
@@ -287,7 +382,7 @@ class RVResults(Results):
             elif not isinstance(type, (tuple, list)):
                 raise Exception("I don't know how to plot a " + str(type))
         
-        dim = get_dimension(self)
+        dim = 1 if self._dim == 0 else self._dim
         if dim == 1:
             counts = self._get_counts()
             heights = counts.values()
@@ -316,8 +411,9 @@ class RVResults(Results):
                     if len(type) == 1:
                         plt.ylabel('Relative Frequency')
                 else:
-                    density = compute_density(self)
-                    xs = np.linspace(min(self), max(self), 1000)
+                    res = self._as_array
+                    density = compute_density(res)
+                    xs = np.linspace(res.min(), res.max(), 1000)
                     ax.plot(xs, density(xs), linewidth=2, color=color)
                     if len(type) == 1 or (len(type) == 2 and 'rug' in type):
                         plt.ylabel('Density')
@@ -326,31 +422,31 @@ class RVResults(Results):
                 ax.hist(self, color=color, bins=bins, alpha=alpha, normed=True, **kwargs)
                 plt.ylabel("Density" if normalize else "Count")
             elif 'impulse' in type:
-                x = list(counts.keys())
-                y = list(counts.values())
+                x = np.fromiter(counts.keys(), dtype=float)
+                y = np.fromiter(counts.values(), dtype=float)
                 if alpha is None:
                     alpha = .7
                 if normalize:
-                    y_tot = sum(y)
-                    y = [i / y_tot for i in y]
+                    y /= y.sum()
                 if jitter:
-                    a = .02 * (max(x) - min(x))
-                    noise = np.random.uniform(low=-a, high=a)
-                    x = [i + noise for i in x]
+                    a = .02 * (x.max() - x.min())
+                    x += np.random.uniform(low=-a, high=a)
                 # plot the impulses
                 ax.vlines(x, 0, y, color=color, alpha=alpha, **kwargs)
                 configure_axes(ax, x, y, ylabel="Relative Frequency" if normalize else "Count")
             if 'rug' in type:
+                res = self._as_array
                 if discrete:
-                    self = self + np.random.normal(loc=0, scale=.002 * (max(self) - min(self)), size=len(self))
-                ax.plot(list(self), [0.001]*len(self), '|', linewidth = 5, color='k')
+                    res = res + np.random.normal(loc=0, scale=.002 * (res.max() - res.min()), size=len(res))
+                ax.plot(res, np.full(len(res), 0.001), '|', linewidth = 5, color='k')
                 if len(type) == 1:
                     setup_ticks([], [], ax.yaxis)
         elif dim == 2:
+            res = self._as_array
             x, y = zip(*self)
 
-            x_count = count_var(x)
-            y_count = count_var(y)
+            x_count = Counter(x)
+            y_count = Counter(y)
             x_height = x_count.values()
             y_height = y_count.values()
             discrete_x = is_discrete(x_height)
@@ -371,10 +467,11 @@ class RVResults(Results):
                 ax_marg_y = fig.add_subplot(gs[1:4, 3])
                 color = get_next_color(ax)
                 if 'density' in type:
-                    densityX = compute_density(x)
-                    densityY = compute_density(y)
-                    x_lines = np.linspace(min(x), max(x), 1000)
-                    y_lines = np.linspace(min(y), max(y), 1000)
+                    x_res, y_res = res[:, 0], res[:, 1]
+                    densityX = compute_density(x_res)
+                    densityY = compute_density(y_res)
+                    x_lines = np.linspace(x_res.min(), x_res.max(), 1000)
+                    y_lines = np.linspace(y_res.min(), y_res.max(), 1000)
                     ax_marg_x.plot(x_lines, densityX(x_lines), linewidth=2, color=get_next_color(ax))
                     ax_marg_y.plot(y_lines, densityY(y_lines), linewidth=2, color=get_next_color(ax), 
                                   transform=Affine2D().rotate_deg(270) + ax_marg_y.transData)
@@ -396,8 +493,6 @@ class RVResults(Results):
                 ax = plt.gca()
                 color = get_next_color(ax)
 
-            nullfmt = NullFormatter() #removes labels on fig
-
             if 'scatter' in type:
                 if jitter:
                     x += np.random.normal(loc=0, scale=.01 * (max(x) - min(x)), size=len(x))
@@ -412,13 +507,12 @@ class RVResults(Results):
                     new_labels.append(int(label.get_text()) / len(x))
                 caxes.set_yticklabels(new_labels)
             elif 'density' in type:
-                den = make_density2D(x, y, ax)
+                den = make_density2D(res, ax)
                 add_colorbar(fig, type, den, 'Density')
             elif 'tile' in type:
                 hm = make_tile(x, y, bins, discrete_x, discrete_y, ax)
                 add_colorbar(fig, type, hm, 'Relative Frequency')
             elif 'violin' in type:
-                res = np.array(self)
                 if discrete_x and not discrete_y:
                     positions = sorted(list(x_count.keys()))
                     make_violin(res, positions, ax, 'x', alpha)
@@ -434,52 +528,54 @@ class RVResults(Results):
                 plt.plot(x, 'k.-', alpha=alpha, **kwargs)
 
     def cov(self, **kwargs):
-        if get_dimension(self) == 2:
-            return np.cov(self, rowvar=False)[0, 1]
-        elif get_dimension(self) > 0:
-            return np.cov(self, rowvar=False)
+        if self._dim == 2:
+            return np.cov(self._as_array, rowvar=False)[0, 1]
+        elif self._dim is not None:
+            return np.cov(self._as_array, rowvar=False)
         else:
             raise Exception("Covariance requires that the simulation results have consistent dimension.")
 
     def corr(self, **kwargs):
-        if get_dimension(self) == 2:
-            return np.corrcoef(self, rowvar=False)[0, 1]
-        elif get_dimension(self) > 0:
-            return np.corrcoef(self, rowvar=False)
+        if self._dim == 2:
+            return np.corrcoef(self._as_array, rowvar=False)[0, 1]
+        elif self._dim is not None:
+            return np.corrcoef(self._as_array, rowvar=False)
         else:
             raise Exception("Correlation requires that the simulation results have consistent dimension.")
 
     def mean(self):
-        if all(is_scalar(x) for x in self):
-            return np.array(self).mean()
-        elif get_dimension(self) > 0:
-            return tuple(np.array(self).mean(0))
+        if self._dim == 0:
+            return self._as_array.mean()
+        elif self._dim:
+            return tuple(self._as_array.mean(0))
         else:
             raise Exception("I don't know how to take the mean of these values.")
 
     def var(self):
-        if all(is_scalar(x) for x in self):
-            return np.array(self).var()
-        elif get_dimension(self) > 0:
-            return tuple(np.array(self).var(0))
+        if self._dim == 0:
+            return self._as_array.var()
+        elif self._dim:
+            return tuple(self._as_array.var(0))
         else:
             raise Exception("I don't know how to take the variance of these values.")
 
     def sd(self):
-        if all(is_scalar(x) for x in self):
-            return np.array(self).std()
-        elif get_dimension(self) > 0:
-            return tuple(np.array(self).std(0))
+        if self._dim == 0:
+            return self._as_array.std()
+        elif self._dim:
+            return tuple(self._as_array.std(0))
         else:
             raise Exception("I don't know how to take the variance of these values.")
 
     def standardize(self):
-        mean_ = self.mean()
-        sd_ = self.sd() 
-        if all(is_scalar(x) for x in self):
-            return RVResults((x - mean_) / sd_ for x in self)
-        elif get_dimension(self) > 0:
-            return RVResults((np.asarray(self) - mean_) / sd_)
+        if self._dim == 0:
+            res = self._as_array
+            return RVResults((res - res.mean()) / res.std())
+        elif self._dim:
+            res = self._as_array
+            return RVResults((res - res.mean(0)) / res.std(0))
+        else:
+            raise Exception("I don't know how to standardize these values.")
 
 
 class RandomProcessResults(Results):
@@ -500,9 +596,21 @@ class RandomProcessResults(Results):
             nmax = int(np.ceil(tmax * self.timeIndex.fs))
             ts = [self.timeIndex[n] for n in range(nmin, nmax)]
             style = "k.--"
-        for x in self:
-            y = [x[t] for t in ts]
-            plt.plot(ts, y, style, alpha=alpha, **kwargs)
+        # evaluate each sample path at all of the times at once
+        Y = np.empty((len(self), len(ts)))
+        for i, x in enumerate(self):
+            y = x.evaluate(ts)
+            if y.ndim != 1 or y.dtype.kind not in "biuf":
+                Y = None
+                break
+            Y[i] = y
+        if Y is not None:
+            # plot all of the sample paths at once
+            plt.plot(ts, Y.T, style, alpha=alpha, **kwargs)
+        else:
+            # e.g., paths whose values are state labels
+            for x in self:
+                plt.plot(ts, x.evaluate(ts), style, alpha=alpha, **kwargs)
         plt.xlabel("Time (t)")
 
         # expand the y-axis slightly
@@ -24,11 +24,45 @@ class InfiniteSequence:
     def __str__(self):
         return str(tuple([self.fun(n) for n in range(10)] + ["..."]))
 
+class RandomSequence(InfiniteSequence):
+    """An infinite sequence whose terms are simulated in order.
+
+    Each new term is simulated by next_term(terms), where terms is
+    the list of terms simulated so far. Terms are cached, so each
+    one is only simulated once. The state of numpy's random number
+    generator is saved between extensions of the sequence, and the
+    global state is restored afterwards.
+    """
+
+    def __init__(self, next_term, seed):
+        self.next_term = next_term
+        self.seed = seed
+        self.state = None
+        self.terms = []
+        super().__init__(self.get)
+
+    def get(self, n):
+        if n >= len(self.terms):
+            global_state = np.random.get_state()
+            if self.state is None:
+                np.random.seed(self.seed)
+            else:
+                np.random.set_state(self.state)
+            try:
+                while n >= len(self.terms):
+                    self.terms.append(self.next_term(self.terms))
+            finally:
+                self.state = np.random.get_state()
+                np.random.set_state(global_state)
+        return self.terms[int(n)]
+
 class TimeFunction:
 
-    def __init__(self, fun, timeIndex):
+    def __init__(self, fun, timeIndex, vectorized=False):
         self.fun = fun
         self.timeIndex = timeIndex
+        # whether fun can be evaluated at an array of times at once
+        self.vectorized = vectorized
 
     def __getitem__(self, t):
         return self.fun(t)
@@ -36,6 +70,13 @@ class TimeFunction:
     def __call__(self, t):
         return self.fun(t)
 
+    def evaluate(self, ts):
+        """Evaluates the function at each of the times in ts."""
+        if self.vectorized:
+            return np.asarray(self.fun(np.asarray(ts)))
+        else:
+            return np.array([self.fun(t) for t in ts])
+
     def __str__(self):
         if self.timeIndex.fs == float("inf"):
             return "(continuous-time function)"
@@ -51,8 +92,7 @@ class TimeFunction:
             nmin = int(np.floor(tmin * self.timeIndex.fs))
             nmax = int(np.ceil(tmax * self.timeIndex.fs))
             ts = [self.timeIndex[n] for n in range(nmin, nmax + 1)]
-        y = [self[t] for t in ts]
-        plt.plot(ts, y, *args, **kwargs)
+        plt.plot(ts, self.evaluate(ts), *args, **kwargs)
 
     def _operation_factory(self, op):
         def op_fun(self, other):
@@ -321,6 +321,11 @@ class TestExponential(unittest.TestCase):
     def test_Exponential_error(self):
         self.assertRaises(Exception, lambda: Exponential(rate=-5))
 
+    def test_Exponential_inf_draws_are_floats(self):
+        x = (Exponential(rate=2) ** inf).draw()
+        self.assertIsInstance(x[3], float)
+        self.assertEqual(type(x[3]), type(Exponential(rate=2).draw()))
+
     def test_Exponential_to_Gamma(self):
         X = RV(Exponential(rate=0.9))
         sims = X.sim(Nsim)
@@ -0,0 +1,33 @@
+import unittest
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+from symbulate.plot import make_tile
+
+
+class TestTile(unittest.TestCase):
+
+    def test_tile_minimum_in_first_bin(self):
+        x = [0., 1., 2., 3., 4.]
+        y = [0., 0., 0., 0., 0.]
+        fig, ax = plt.subplots()
+        hm = make_tile(x, y, 4, False, True, ax)
+        intensity = hm.get_array()
+        plt.close(fig)
+        self.assertEqual(intensity.shape, (1, 4))
+        # the minimum 0 and 1 fall in the first bin [0, 1]
+        self.assertAlmostEqual(intensity[0, 0], 2 / 5)
+        self.assertAlmostEqual(intensity[0, -1], 1 / 5)
+        self.assertAlmostEqual(intensity.sum(), 1)
+
+    def test_tile_sums_to_one(self):
+        x = np.random.normal(size=100)
+        y = np.random.normal(size=100)
+        fig, ax = plt.subplots()
+        hm = make_tile(x, y, 10, False, False, ax)
+        intensity = hm.get_array()
+        plt.close(fig)
+        self.assertEqual(intensity.shape, (10, 10))
+        self.assertAlmostEqual(intensity.sum(), 1)
@@ -0,0 +1,103 @@
+import unittest
+import numpy as np
+import scipy.stats as stats
+
+from symbulate import *
+import symbulate.seed as symbulate_seed
+
+Nsim = 10000
+
+
+class TestPoissonProcess(unittest.TestCase):
+
+    def test_PoissonProcess_to_Poisson(self):
+        exp_list, obs_list = [], []
+        N = PoissonProcess(rate=2)
+        sims = N[1.5].sim(Nsim)
+        simulated = sims.tabulate()
+        for k in range(15):
+            expected = Nsim * stats.poisson(mu=3).pmf(k)
+            if expected > 5:
+                exp_list.append(expected)
+                obs_list.append(simulated[k])
+        # lump the remaining counts into the last cell
+        exp_list[-1] += Nsim - sum(exp_list)
+        obs_list[-1] += Nsim - sum(obs_list)
+        pval = stats.chisquare(obs_list, exp_list).pvalue
+        self.assertTrue(pval > 0.01)
+
+    def test_PoissonProcess_vector_times(self):
+        N = PoissonProcess(rate=5)
+        x = N.draw()
+        ts = np.linspace(0, 10, 50)
+        counts = x(ts)
+        self.assertTrue(all(counts[i] == x(t) for i, t in enumerate(ts)))
+        self.assertTrue(all(np.diff(counts) >= 0))
+
+
+class TestRandomProcess(unittest.TestCase):
+
+    def test_setitem_redefine(self):
+        X = RandomProcess(Bernoulli(0.5) ** inf, TimeIndex(1))
+        X[0] = 1
+        X[1] = X[0] + 1
+        X[0] = X[0] + 10
+        sims = (X[0] & X[1]).sim(10)
+        self.assertTrue(all(sim == (11, 2) for sim in sims))
+
+    def test_setitem_operand_after_operation(self):
+        N = PoissonProcess(rate=1)
+        Y = 2 * N
+        N[1] = 100
+        self.assertFalse(Y._vectorized)
+        for y in Y.sim(5):
+            self.assertEqual(y.evaluate([0.5, 1, 2])[1], 200)
+            self.assertEqual(y[1], 200)
+
+    def test_vectorized_power(self):
+        N = PoissonProcess(rate=1)
+        self.assertTrue((N ** 2)._vectorized)
+        self.assertFalse((N ** -1)._vectorized)
+        self.assertFalse((2 ** N)._vectorized)
+        ts = np.linspace(0, 5, 20)
+        for y in (N ** 2).sim(5):
+            self.assertTrue(np.array_equal(y.evaluate(ts),
+                                           [y(t) for t in ts]))
+
+
+class TestRandomSequence(unittest.TestCase):
+
+    def test_terms_unchanged_by_other_sequences(self):
+        P = Normal(0, 1) ** inf
+        start = symbulate_seed.seed
+        x, y = P.draw(), P.draw()
+        y[50]
+        first = x[5]
+        y[100]
+        x[20]
+        self.assertEqual(x[5], first)
+        # the same sequence, drawn again without interleaved lookups
+        symbulate_seed.seed = start
+        self.assertEqual(P.draw()[5], first)
+
+    def test_global_state_restored(self):
+        x = BoxModel([0, 1], size=inf).draw()
+        before = np.random.get_state()
+        x[100]
+        after = np.random.get_state()
+        self.assertEqual(before[0], after[0])
+        self.assertTrue(np.array_equal(before[1], after[1]))
+        self.assertEqual(before[2:], after[2:])
+
+    def test_MarkovChain_out_of_order(self):
+        P = [[0.5, 0.5, 0], [0.2, 0.3, 0.5], [0, 0.4, 0.6]]
+        X = MarkovChain(P, [1, 0, 0])
+        start = symbulate_seed.seed
+        path = X.draw()
+        out_of_order = [path[n] for n in (20, 3, 11, 0)]
+        # draw the same path again by reusing its seed
+        symbulate_seed.seed = start
+        path = X.draw()
+        in_order = [path[n] for n in range(21)]
+        self.assertEqual(out_of_order,
+                         [in_order[n] for n in (20, 3, 11, 0)])
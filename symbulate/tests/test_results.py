@@ -0,0 +1,108 @@
+import unittest
+
+from symbulate.results import Results, RVResults
+
+
+class TestResultsCache(unittest.TestCase):
+
+    def test_mutation_clears_cache(self):
+        r = RVResults([1., 2., 3.])
+        self.assertEqual(r.mean(), 2.0)
+        r.append(100.)
+        r += [200.]
+        self.assertAlmostEqual(r.mean(), 61.2)
+        self.assertEqual(r.count_gt(1), 4)
+
+    def test_each_mutation_clears_cache(self):
+        mutations = [
+            lambda r: r.extend([10.]),
+            lambda r: r.insert(0, 10.),
+            lambda r: r.pop(),
+            lambda r: r.remove(3.),
+            lambda r: r.__setitem__(0, 10.),
+            lambda r: r.__delitem__(0),
+            lambda r: r.__imul__(2),
+            lambda r: r.clear(),
+        ]
+        for mutate in mutations:
+            r = RVResults([1., 2., 3.])
+            r.count_eq(1.)
+            mutate(r)
+            self.assertEqual(r.count_eq(10.), list(r).count(10.))
+            self.assertEqual(r.count_geq(1.), len(r))
+
+    def test_mutation_clears_dimension(self):
+        r = RVResults([1, 2, 3])
+        self.assertEqual(r._dim, 0)
+        r.append((1, 2))
+        self.assertIsNone(r._dim)
+        with self.assertRaises(Exception):
+            r.mean()
+        r[:] = [(1, 2), (3, 4)]
+        self.assertEqual(r._dim, 2)
+        self.assertEqual(r.mean(), (2, 3))
+
+
+class TestResultsCompare(unittest.TestCase):
+
+    functions = {
+        "eq": lambda x, v: x == v,
+        "neq": lambda x, v: x != v,
+        "lt": lambda x, v: x < v,
+        "leq": lambda x, v: x <= v,
+        "gt": lambda x, v: x > v,
+        "geq": lambda x, v: x >= v,
+    }
+
+    def check_same_as_fallback(self, results, value):
+        for name, compare in self.functions.items():
+            fun = lambda x: compare(x, value)
+            self.assertEqual(getattr(results, "count_" + name)(value),
+                             results.count(fun))
+            self.assertEqual(list(getattr(results, "filter_" + name)(value)),
+                             list(results.filter(fun)))
+
+    def test_numeric(self):
+        r = Results([3, 1, 2, 1, 5, 0])
+        self.assertIsNotNone(r._compare(lambda x, v: x == v, 1))
+        self.check_same_as_fallback(r, 1)
+        self.check_same_as_fallback(RVResults([0.5, 1.5, 1.0]), 1)
+
+    def test_tuples(self):
+        r = Results([(1, 2), (1, 1), (2, 2)])
+        self.assertIsNone(r._compare(lambda x, v: x == v, 1))
+        self.assertIsNone(r._array)
+        for name in ("eq", "neq"):
+            compare = self.functions[name]
+            fun = lambda x: compare(x, 1)
+            self.assertEqual(getattr(r, "count_" + name)(1), r.count(fun))
+
+    def test_strings(self):
+        r = Results(["H", "T", "H", "HT"])
+        self.assertIsNone(r._compare(lambda x, v: x == v, 1))
+        self.assertIsNone(r._array)
+        self.assertEqual(r.count_eq(1), 0)
+        self.assertEqual(r.count_neq(1), 4)
+
+    def test_ragged(self):
+        r = Results([[1, 2], [3], [1, 2]])
+        self.assertIsNone(r._compare(lambda x, v: x == v, 1))
+        self.assertIsNone(r._array)
+        self.assertEqual(r.count_eq(1), 0)
+        self.assertEqual(list(r.filter_neq(1)), [[1, 2], [3], [1, 2]])
+
+
+class TestResultsHTML(unittest.TestCase):
+
+    def test_repr_html_rows(self):
+        html = Results("x%d" % i for i in range(9))._repr_html_()
+        self.assertEqual(html.count("<tr>"), 9)
+        self.assertNotIn("...", html)
+        self.assertEqual(html.count("<td>x8</td>"), 1)
+
+        html = Results("x%d" % i for i in range(10))._repr_html_()
+        # the first 9 rows, the ellipsis row and the last row
+        self.assertEqual(html.count("<tr>"), 11)
+        self.assertEqual(html.count("<td>...</td>"), 2)
+        self.assertEqual(html.count("<td>x8</td>"), 1)
+        self.assertEqual(html.count("<td>x9</td>"), 1)